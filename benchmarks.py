@@ -0,0 +1,125 @@
+"""Benchmarks of the text conversion in program_maker
+
+usage: python benchmarks.py [sessions_csv]
+
+The corpus are all strings of a ConfTool export that are converted to
+tex code (titles, names, organisations and abstracts).
+"""
+
+import sys
+import subprocess
+from timeit import default_timer
+from program_maker import structure, unicode_tex
+
+
+def text_corpus(sessions_csv):
+    rtn = []
+    for session in structure.Conference.iter_sessions(sessions_csv):
+        rtn.extend([session.title, session.chair])
+        for c in session.contributions:
+            rtn.append(c.title)
+            rtn.append(c.abstract)
+            rtn.extend(c.first_names)
+            rtn.extend(c.last_names)
+            rtn.extend(c.unique_organisations)
+    return rtn
+
+
+def best_time(function, strings, repeat=5):
+    # returns the fastest of repeated runs of function over all strings (seconds)
+    rtn = None
+    for _ in range(repeat):
+        t = default_timer()
+        for s in strings:
+            function(s)
+        t = default_timer() - t
+        if rtn is None or t < rtn:
+            rtn = t
+    return rtn
+
+
+def report(name, seconds, strings):
+    n_chars = sum([len(x) for x in strings])
+    print("{0:<40} {1:8.1f} ms {2:8.2f} MB/s".format(name, seconds*1000,
+                                                      n_chars/seconds/1e6))
+
+
+# reference implementations
+def per_char_unicode_to_tex(s):
+    get = unicode_tex.get_unicode_to_tex_map().get
+    return u''.join([get(i, i) for i in s])
+
+
+def benchmark_unicode_to_tex(strings):
+    for s in strings:
+        assert unicode_tex.unicode_to_tex(s) == per_char_unicode_to_tex(s)
+    report("unicode_to_tex (per character)",
+           best_time(per_char_unicode_to_tex, strings), strings)
+    max_length = unicode_tex.escape_cache_max_length
+    unicode_tex.escape_cache_max_length = 0
+    report("unicode_to_tex (without cache)",
+           best_time(unicode_tex.unicode_to_tex, strings), strings)
+    unicode_tex.escape_cache_max_length = max_length
+
+    def cold_cache(strings):
+        # all strings with an empty cache
+        unicode_tex.escape_cache.clear()
+        for s in strings:
+            unicode_tex.unicode_to_tex(s)
+    report("unicode_to_tex (cold cache)", best_time(cold_cache, [strings]),
+           strings)
+
+
+def per_char_tex_to_unicode(s):
+    get = unicode_tex.get_tex_to_unicode_map().get
+    return u''.join([get(i, i) for i in s])
+
+
+def benchmark_tex_to_unicode(sessions_csv, n_abstracts=5000):
+    # decoding of abstracts with latex code (abstracts of the export
+    # converted with unicode_to_tex)
+    abstracts = []
+    for session in structure.Conference.iter_sessions(sessions_csv):
+        abstracts.extend([unicode_tex.unicode_to_tex(c.abstract)
+                          for c in session.contributions])
+    abstracts = (abstracts * (n_abstracts // len(abstracts) + 1))[:n_abstracts]
+    report("tex_to_unicode (per character)",
+           best_time(per_char_tex_to_unicode, abstracts), abstracts)
+    report("tex_to_unicode ({0} abstracts)".format(len(abstracts)),
+           best_time(unicode_tex.tex_to_unicode, abstracts), abstracts)
+
+
+def benchmark_import(repeat=10):
+    # startup time of a python process that imports unicode_tex and converts
+    # ascii or non-ascii text (the latter loads the unicode_tex_maps)
+
+    def startup(code):
+        rtn = None
+        for _ in range(repeat):
+            t = default_timer()
+            subprocess.check_call([sys.executable, "-c", code])
+            t = default_timer() - t
+            if rtn is None or t < rtn:
+                rtn = t
+        return rtn
+
+    imp = "from program_maker import unicode_tex; "
+    base = startup("pass")
+    for name, code in [("import", imp),
+                       ("import + ascii conversion", imp + "unicode_tex.unicode_to_tex(u'a&b')"),
+                       ("import + unicode conversion", imp + "unicode_tex.unicode_to_tex(u'\\xe4')")]:
+        print("{0:<40} {1:8.1f} ms".format(name, (startup(code) - base)*1000))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sessions_csv = sys.argv[1]
+    else:
+        sessions_csv = 'ESCoP2017_sessions.csv'
+
+    strings = text_corpus(sessions_csv)
+    print("corpus: {0} strings, {1} characters".format(len(strings),
+                                        sum([len(x) for x in strings])))
+    benchmark_unicode_to_tex(strings)
+    benchmark_tex_to_unicode(sessions_csv)
+    benchmark_import()
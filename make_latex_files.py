@@ -1,10 +1,17 @@
-from program_maker import structure, latex_convert
+from program_maker import structure, latex_convert, unicode_tex
 
 sessions_csv='ESCoP2017_sessions.csv'
-escop = structure.Conference(sessions_csv)
+escop = structure.Conference.load(sessions_csv, cache_dir=".conference_cache")
 
-latex_convert.contribution_list(escop, filename="contributions.incl.tex", talks_first=True)
-latex_convert.abstracts(escop, filename="abstracts.incl.tex", write_index=True)
-latex_convert.overview_table_code(escop, filename="overview.incl.tex")
+fragments = latex_convert.FragmentCache(".conference_cache/fragments")
+latex_convert.render(escop, [
+    latex_convert.ContributionListEmitter("contributions.incl.tex", talks_first=True,
+                                          cache=fragments),
+    latex_convert.AbstractsEmitter("abstracts.incl.tex", cache=fragments),
+    latex_convert.AuthorIndexEmitter("authorindex.incl.tex"),
+    latex_convert.OverviewEmitter("overview.incl.tex")])
+fragments.prune()
 
+print("fragment cache: {0} hits, {1} misses".format(fragments.hits, fragments.misses))
+print("escape cache: {hits} hits, {misses} misses".format(**unicode_tex.escape_cache_info()))
 print("copy this files to your escop_tex folder")
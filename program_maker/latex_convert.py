@@ -1,4 +1,12 @@
-from unicode_tex import tex_args, unicode_to_tex
+import os
+import io
+import codecs
+from hashlib import sha1
+from itertools import izip
+from multiprocessing import Pool
+from unicode_tex import unicode_to_tex
+from structure import file_hash, replace_file
+import tex_templates as tpl
 
 # helper
 def plain_name(surname_comma_first_name):
@@ -14,184 +22,638 @@ def punctuation(txt):
     return txt
 
 
-def contribution_list(conference, filename, list_contributions=True, talks_first=False):
+class TexFile(object):
+    # streaming text sink: unicode text is encoded incrementally to UTF-8 and
+    # written to a buffered file, use as context manager
+    # The text is written to a temporary file, which replaces filename
+    # only if the content differs from the existing file. That is, files
+    # with unchanged content keep their modification time.
+
+    def __init__(self, filename, buffer_size=65536):
+        self.filename = filename
+        self.changed = None
+        self._tmp_filename = filename + ".tmp"
+        self._file = io.open(self._tmp_filename, "wb", buffering=buffer_size)
+        self._encode = codecs.getincrementalencoder("UTF-8")().encode
+        self._hash = sha1()
+
+    def write(self, txt):
+        data = self._encode(txt)
+        self._hash.update(data)
+        self._file.write(data)
+
+    def writelines(self, lines):
+        for txt in lines:
+            self.write(txt)
+
+    def close(self):
+        data = self._encode(u"", True)
+        self._hash.update(data)
+        self._file.write(data)
+        self._file.close()
+        self.changed = self._hash.hexdigest() != file_hash(self.filename).hexdigest
+        if self.changed:
+            print("writing: " + self.filename)
+            replace_file(self._tmp_filename, self.filename)
+        else:
+            print("unchanged: " + self.filename)
+            os.remove(self._tmp_filename)
+
+    def abort(self):
+        # closes and removes the temporary file, filename is not changed
+        self._file.close()
+        os.remove(self._tmp_filename)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+FRAGMENT_VERSION = 3 # increase, if the rendering of the fragments changes
+
+class FragmentCache(object):
+    # disk cache of rendered tex fragments of sessions
+    # Fragments are stored as files in cache_dir, keyed by the content hash
+    # of the session (see fragment_key). The total size of the cache is
+    # limited to max_size bytes, prune() removes the least recently used
+    # fragments (file modification time is updated by get).
+
+    def __init__(self, cache_dir, max_size=32*1024*1024):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fragment_key(renderer, session, *parameter):
+        # key of the fragment of a session rendered by renderer
+        # The key depends on the raw csv row of the session, the conference
+        # ids and the organisation names (both depend on the whole
+        # conference) and the booklet macros.
+        x = (FRAGMENT_VERSION, tpl.templates_hash(), renderer, parameter,
+             session.content_hash,
+             [(c.conf_id, c.unique_organisations) for c in session.contributions])
+        return sha1(repr(x)).hexdigest()
+
+    def _filename(self, key):
+        return os.path.join(self.cache_dir, key + ".tex")
+
+    def get(self, key):
+        # returns the cached fragment or None
+        filename = self._filename(key)
+        try:
+            with open(filename, "rb") as f:
+                txt = f.read().decode("UTF-8")
+            os.utime(filename, None) # recently used
+        except (IOError, OSError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return txt
+
+    def put(self, key, txt):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        filename = self._filename(key)
+        tmp_filename = filename + ".tmp"
+        with open(tmp_filename, "wb") as f:
+            f.write(txt.encode("UTF-8"))
+        replace_file(tmp_filename, filename)
+
+    def prune(self):
+        # removes the least recently used fragments, if the cache exceeds
+        # max_size
+        try:
+            filenames = [os.path.join(self.cache_dir, x)
+                         for x in os.listdir(self.cache_dir) if x.endswith(".tex")]
+        except OSError:
+            return
+        files = []
+        for x in filenames:
+            st = os.stat(x)
+            files.append((st.st_mtime, st.st_size, x))
+        size = sum([x[1] for x in files])
+        for mtime, file_size, x in sorted(files):
+            if size <= self.max_size:
+                break
+            os.remove(x)
+            size -= file_size
+
+
+class SessionValues(object):
+    # values of a session and its contributions that are derived for the
+    # rendering. The values are computed on first use and shared by all
+    # emitters of render(). The lists of contribution values are in the
+    # order of session.contributions.
+
+    __slots__ = ("session", "_values")
+
+    def __init__(self, session):
+        self.session = session
+        self._values = {}
+
+    def _get(self, name, function, *args):
+        try:
+            return self._values[(name,) + args]
+        except KeyError:
+            rtn = self._values[(name,) + args] = function(*args)
+            return rtn
+
+    @property
+    def start_end(self):
+        # (start, end) time of the session
+        return self._get("start_end", lambda: (self.session.start_str,
+                                               self.session.end_str))
+
+    @property
+    def weekday(self):
+        return self._get("weekday", lambda: self.session.weekday)
+
+    @property
+    def contribution_times(self):
+        # (start, end) times of the contributions, (None, None) for
+        # contributions without time (posters)
+        return self._get("contribution_times", lambda: [(c.start_str, c.end_str) if c.start is not None
+                                                        else (None, None)
+                                                        for c in self.session.contributions])
+
+    @property
+    def titles(self):
+        # contribution titles with punctuation
+        return self._get("titles", lambda: [punctuation(c.title)
+                                            for c in self.session.contributions])
+
+    @property
+    def short_authors(self):
+        # authors (last names) with punctuation
+        return self._get("short_authors", lambda: [punctuation(c.formated_authors(fullnames=False,
+                                                                                  first_name_initials=False))
+                                                   for c in self.session.contributions])
+
+    def tex_authors(self, write_index=False):
+        # tex code of the authors (full names) with affiliation ids
+        return self._get("tex_authors", lambda x: [c.formated_authors(fullnames=True, first_name_initials=False,
+                                                                      affiliation_ids=True,
+                                                                      orga_id_format=u"$^{{{0}}}$",
+                                                                      tex_code=True,
+                                                                      write_index=x)
+                                                   for c in self.session.contributions],
+                         write_index)
+
+    @property
+    def tex_organisations(self):
+        return self._get("tex_organisations", lambda: [c.formated_organisations(orga_id_format=u"$^{{{0}}}$",
+                                                                                tex_code=True)
+                                                       for c in self.session.contributions])
+
+    @property
+    def tex_abstracts(self):
+        return self._get("tex_abstracts", lambda: [unicode_to_tex(c.abstract)
+                                                   for c in self.session.contributions])
+
+
+class Emitter(object):
+    # output format of render()
+    # render() traverses the conference once in the order of the program
+    # and calls for each emitter:
+    #   begin(conference)
+    #   for each day: day_begin(day, weekday),
+    #                 time_slot(day, time, sessions) for each time and
+    #                 day_end(day)
+    #   end()
+    # sessions: list of SessionValues of the time slot (sorted by room)
+    # abort() is called instead of end(), if the rendering fails.
+
+    def begin(self, conference):
+        pass
+
+    def day_begin(self, day, weekday):
+        pass
+
+    def time_slot(self, day, time, sessions):
+        pass
+
+    def day_end(self, day):
+        pass
+
+    def end(self):
+        pass
+
+    def abort(self):
+        pass
+
+
+class FragmentEmitter(Emitter):
+    # emitter that renders the sessions with the function
+    # renderer(args, values), args: (session,) + parameter
+    # The rendered sessions are stored in the FragmentCache cache.
+    # If the rendering is done in a pool of processes (see render), the
+    # sessions are rendered before the traversal.
+
+    renderer = None
+
+    def __init__(self, parameter, cache=None):
+        self.parameter = tuple(parameter)
+        self.cache = cache
+        self._rendered = {}
+
+    def _key(self, session):
+        return self.cache.fragment_key(self.renderer.__name__, session, *self.parameter)
+
+    def prerender(self, sessions, jobs):
+        # renders all sessions, which are not cached, in a pool of processes
+        todo = []
+        for session in sessions:
+            txt = None
+            if self.cache is not None:
+                txt = self.cache.get(self._key(session))
+            if txt is None:
+                todo.append(session)
+            else:
+                self._rendered[id(session)] = txt
+        if len(todo) == 0:
+            return
+
+        pool = Pool(min(jobs, len(todo)))
+        try:
+            rendered = pool.imap(self.renderer, [(x,) + self.parameter for x in todo],
+                                 chunksize=max(1, len(todo) // (4 * jobs)))
+            for session, txt in izip(todo, rendered):
+                self._rendered[id(session)] = txt
+                if self.cache is not None:
+                    self.cache.put(self._key(session), txt)
+        finally:
+            pool.close()
+            pool.join()
+
+    def fragment(self, values):
+        # returns the tex code of a session
+        try:
+            return self._rendered.pop(id(values.session))
+        except KeyError:
+            pass
+        if self.cache is not None:
+            key = self._key(values.session)
+            txt = self.cache.get(key)
+            if txt is not None:
+                return txt
+        txt = self.renderer((values.session,) + self.parameter, values)
+        if self.cache is not None:
+            self.cache.put(key, txt)
+        return txt
+
+
+def render(conference, emitters, jobs=None):
+    # renders the conference with all emitters in one traversal
     # conference: conference_structure.Conference
+    # emitters: list of Emitter
+    # jobs: number of processes, if jobs>1, the sessions of FragmentEmitters
+    #       are rendered in a pool of processes
+
+    try:
+        if jobs is not None and jobs > 1:
+            sessions = conference.get_all_sessions()
+            for e in emitters:
+                if isinstance(e, FragmentEmitter):
+                    e.prerender(sessions, jobs)
+
+        for e in emitters:
+            e.begin(conference)
+        for d in conference.get_day_ids():
+            slots = [(t, [SessionValues(conference.get_session(d, t, r))
+                          for r in conference.get_rooms(d, t)])
+                     for t in conference.get_times(d)]
+            weekday = slots[0][1][0].weekday
+            for e in emitters:
+                e.day_begin(d, weekday)
+            for t, sessions in slots:
+                for e in emitters:
+                    e.time_slot(d, t, sessions)
+            for e in emitters:
+                e.day_end(d)
+    except:
+        for e in emitters:
+            e.abort()
+        raise
+    for e in emitters:
+        e.end()
+
 
-    txt = u"%%%% CONTRIBUTION LIST \n"
-    txt += u"%% file: {} (sha1: {}) \n".format(conference.file, conference.file_hash)
-    for d in conference.get_day_ids():
-        weekday = conference.get_all_sessions_at_day(d)[0].weekday
-        txt += u"\n\n\\overviewdaybegin{" + weekday + ", " + str(d) + " September 2017}\n"
-        
-        poster = u""
-        talks = u""
-        for t in conference.get_times(d):
-            newtime_begin_required = True
-            tmptxt = u""
-            for r in conference.get_rooms(d, t):
-                session = conference.get_session(d, t, r)
-                if newtime_begin_required:
-                    if session.type == "poster":
-                        tmptxt += u"\n\\overviewtimeslotbegin" + tex_args(t, session.end_str,
-                                session.title[:session.title.find("-")].strip()) + "\n"
-                    else:
-                        tmptxt += u"\n\\overviewtimeslotbegin" + tex_args(t, session.end_str, "Talks & Symposia") + "\n"
-                    newtime_begin_required = False
-
-                if session.type == "poster":
-                    tmptxt += u"\\overviewposterbegin{}\n"
-                else:
-                    if session.type == "symposium":
-                        type_txt = "Symposium"
-                        if len(session.chair) > 0:
-                            info_code = u"{\\newline{\\itshape Organized by " + unicode_to_tex(plain_name(session.chair)) + u"}}"
-                        else:
-                            info_code = u"{}"
-                    else:
-                        type_txt = ""
-                        if len(session.chair) > 0:
-                            info_code = u"{\\newline{\\itshape Chaired by " + unicode_to_tex(plain_name(session.chair)) + u"}}"
-                        else:
-                            info_code = u"{}"
-
-                    tmptxt += u"\n\\overviewsessionbegin" + tex_args(u"{}-{}".format(session.smallest_conf_id, session.largets_conf_id),
-                                                                 type_txt, session.room,
-                                                                 session.title) + info_code +"\n"
-                if (list_contributions):
-                    for c in session.contributions:
-                        if c.type == "poster":
-                            tmptxt += u"    \\postershort" + tex_args(c.conf_id,
-                                                                   punctuation(c.formated_authors(fullnames=False, first_name_initials=False)),
-                                                                   punctuation(c.title)) +"\n"
-                        else:
-                            tmptxt += u"    \\talkshort" + tex_args(c.conf_id, c.start_str, c.end_str,
-                                                                 punctuation(c.formated_authors(fullnames=False, first_name_initials=False)),
-                                                                 punctuation(c.title)) + "\n"
-                if session.type == "poster":
-                    tmptxt += u"\overviewposterend{}\n\n"
-                else:
-                    tmptxt += u"\overviewsessionend{}\n\n"
-
-            tmptxt += u"\n\\overviewtimeslotend{}\n"
-            if talks_first:
-                if session.type == "poster": # last session type
-                    poster += tmptxt
-                else:
-                    talks += tmptxt
+class _FileEmitter(object):
+    # mixin: emitter that writes the TexFile self.file
+    # header: first line of the file
+
+    header = u""
+
+    def begin(self, conference):
+        self.file = TexFile(self.filename)
+        self.file.write(self.header)
+        self.file.write(u"%% file: {} (sha1: {}) \n".format(conference.file,
+                                                          conference.file_hash))
+
+    def end(self):
+        self.file.close()
+
+    def abort(self):
+        if self.file is not None:
+            self.file.abort()
+
+
+def _contribution_list_session(args, values=None):
+    # returns the contribution list of a session (tex code)
+    # args: (session, list_contributions), a tuple to allow Pool.imap
+    # values: SessionValues of the session
+    session, list_contributions = args
+    if values is None:
+        values = SessionValues(session)
+    txt = []
+    write = txt.append
+    if session.type == "poster":
+        write(tpl.overviewposterbegin())
+    else:
+        if session.type == "symposium":
+            type_txt = "Symposium"
+            if len(session.chair) > 0:
+                info_code = u"\\newline{\\itshape Organized by " + unicode_to_tex(plain_name(session.chair)) + u"}"
+            else:
+                info_code = u""
+        else:
+            type_txt = ""
+            if len(session.chair) > 0:
+                info_code = u"\\newline{\\itshape Chaired by " + unicode_to_tex(plain_name(session.chair)) + u"}"
             else:
-                txt += tmptxt
+                info_code = u""
+
+        write(tpl.overviewsessionbegin(u"{}-{}".format(*session.conf_id_range),
+                                       type_txt, session.room,
+                                       session.title, info_code))
+    if (list_contributions):
+        for c, authors, title, (start, end) in zip(session.contributions, values.short_authors,
+                                                   values.titles, values.contribution_times):
+            if c.type == "poster":
+                write(tpl.postershort(c.conf_id, authors, title))
+            else:
+                write(tpl.talkshort(c.conf_id, start, end, authors, title))
+    if session.type == "poster":
+        write(tpl.overviewposterend())
+    else:
+        write(tpl.overviewsessionend())
+    return u"".join(txt)
+
+
+class ContributionListEmitter(_FileEmitter, FragmentEmitter):
+    # contribution list (see contribution_list)
+
+    header = u"%%%% CONTRIBUTION LIST \n"
+    renderer = staticmethod(_contribution_list_session)
+
+    def __init__(self, filename, list_contributions=True, talks_first=False, cache=None):
+        FragmentEmitter.__init__(self, (list_contributions,), cache=cache)
+        self.filename = filename
+        self.talks_first = talks_first
+        self.file = None
 
-        if talks_first:
-            txt += talks + poster
-        txt += u"\n\n\\overviewdayend{}\n"
+    def day_begin(self, day, weekday):
+        self.file.write(tpl.overviewdaybegin(weekday + ", " + str(day) + " September 2017"))
+        self._poster = [] # if talks_first, poster time slots are written at the end of the day
 
-    print("writing: " + filename)
-    with open(filename, "wb") as f:
-       f.write(txt.encode("UTF-8"))
+    def time_slot(self, day, time, sessions):
+        tmptxt = [] # time slot (type is known after the last session)
+        session = sessions[0].session
+        if session.type == "poster":
+            tmptxt.append(tpl.overviewtimeslotbegin(time, sessions[0].start_end[1],
+                    session.title[:session.title.find("-")].strip()))
+        else:
+            tmptxt.append(tpl.overviewtimeslotbegin(time, sessions[0].start_end[1], "Talks & Symposia"))
+        for values in sessions:
+            tmptxt.append(self.fragment(values))
+        tmptxt.append(tpl.overviewtimeslotend())
 
+        if self.talks_first and sessions[-1].session.type == "poster": # last session type
+            self._poster.extend(tmptxt)
+        else:
+            self.file.writelines(tmptxt)
 
+    def day_end(self, day):
+        self.file.writelines(self._poster)
+        self.file.write(tpl.overviewdayend())
 
-def abstracts(conference, filename, write_index=False):
+
+def contribution_list(conference, filename, list_contributions=True, talks_first=False,
+                      cache=None, jobs=None):
     # conference: conference_structure.Conference
+    # cache: FragmentCache for the rendered sessions
+    # jobs: number of processes to render the sessions
+    render(conference, [ContributionListEmitter(filename, list_contributions=list_contributions,
+                                                talks_first=talks_first, cache=cache)],
+           jobs=jobs)
 
-    poster = u""
-    talks = u""
-    for d in conference.get_day_ids():
-        for session in conference.get_all_sessions_at_day(d):
-            txt = u""
-            session_time = u"{0}, {1} -- {2}".format(session.weekday, session.start_str, session.end_str)
 
+def _abstract_session(args, values=None):
+    # returns the abstracts of a session (tex code)
+    # args: (session, write_index), a tuple to allow Pool.imap
+    # values: SessionValues of the session
+    session, write_index = args
+    if values is None:
+        values = SessionValues(session)
+    txt = []
+    write = txt.append
+    session_time = u"{0}, {1} -- {2}".format(values.weekday, *values.start_end)
+
+    if session.type == "poster":
+        write(tpl.abstractposterbegin(session_time, session.room,
+                                      session.title[:session.title.find("-")].strip()))
+    else:
+        if session.type == "symposium":
+            tmp = "Symposium: " + session.title
+        else:
+            tmp = session.title
+        write(tpl.abstractsessionbegin(session_time,session.room, tmp))
+
+    for c, authors, organisations, title, abstract, times in zip(session.contributions,
+                values.tex_authors(write_index), values.tex_organisations,
+                values.titles, values.tex_abstracts, values.contribution_times):
+        if session.type == "poster":
+            start_time = ""
+        else:
+            start_time = u"{0} -- {1}".format(*times)
+        write(tpl.escopabstract(c.conf_id, start_time, authors, organisations,
+                                title, abstract, c.first_author_email))
+
+    write(tpl.abstractsessionend())
+    return u"".join(txt)
+
+
+class AbstractsEmitter(_FileEmitter, FragmentEmitter):
+    # abstracts, poster sessions are written after all talks (see abstracts)
+    # The sessions of a day are written in the order of
+    # Conference.get_all_sessions_at_day (sorted by conference id).
+
+    header = u"%%%% ABSTRACTS\n"
+    renderer = staticmethod(_abstract_session)
+
+    def __init__(self, filename, write_index=False, cache=None):
+        FragmentEmitter.__init__(self, (write_index,), cache=cache)
+        self.filename = filename
+        self.file = None
+
+    def begin(self, conference):
+        _FileEmitter.begin(self, conference)
+        self.conference = conference
+        self._poster = [] # reset for each render
+
+    def day_begin(self, day, weekday):
+        self._values = {} # id(session): SessionValues
+
+    def time_slot(self, day, time, sessions):
+        for values in sessions:
+            self._values[id(values.session)] = values
+
+    def day_end(self, day):
+        for session in self.conference.get_all_sessions_at_day(day):
+            values = self._values[id(session)]
             if session.type == "poster":
-                txt += u"\n\\abstractposterbegin" + tex_args(session_time, session.room,
-                                                               session.title[:session.title.find("-")].strip()) + "\n"
-            else:
-                if session.type == "symposium":
-                    tmp = "Symposium: " + session.title
-                else:
-                    tmp = session.title
-                txt += u"\n\\abstractsessionbegin" + tex_args(session_time,session.room, tmp) + "\n"
-
-            for c in session.contributions:
-                if session.type == "poster":
-                    start_time = ""
-                else:
-                    start_time = u"{0} -- {1}".format(c.start_str, c.end_str)
-                txt += u"    \\escopabstract" + tex_args(c.conf_id, start_time) + \
-                                        u"{" + c.formated_authors(fullnames=True, first_name_initials=False,
-                                                                  affiliation_ids=True,
-                                                                  orga_id_format=u"$^{{{0}}}$",
-                                                                  tex_code=True,
-                                                                  write_index=write_index) + u"}" + \
-                                        u"{" + c.formated_organisations(orga_id_format=u"$^{{{0}}}$", tex_code=True) + u"}" + \
-                                        tex_args(punctuation(c.title), c.abstract, c.first_author_email) + "\n\n"
-
-            txt += u"\\abstractsessionend{}\n\n"
-            if session.type == "poster":
-                poster += txt
+                self._poster.append(self.fragment(values))
             else:
-                talks += txt
+                self.file.write(self.fragment(values))
 
-    txt = u"%%%% ABSTRACTS\n"
-    txt += u"%% file: {} (sha1: {}) \n".format(conference.file,
-                                                conference.file_hash)
-    txt += talks + poster
+    def end(self):
+        self.file.writelines(self._poster)
+        self.file.close()
 
-    print("writing: " + filename)
-    with open(filename, "wb") as f:
-       f.write(txt.encode("UTF-8"))
 
+def abstracts(conference, filename, write_index=False, cache=None, jobs=None):
+    # conference: conference_structure.Conference
+    # cache: FragmentCache for the rendered sessions
+    # jobs: number of processes, if jobs>1, the sessions are rendered in a
+    #       pool of processes and written in the order of the program
+    render(conference, [AbstractsEmitter(filename, write_index=write_index, cache=cache)],
+           jobs=jobs)
 
-def overview_table_code(conference, filename):
+
+class AuthorIndexEmitter(_FileEmitter, Emitter):
+    # author index (see author_index)
+
+    header = u"%%%% AUTHOR INDEX\n"
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.file = None
+
+    def begin(self, conference):
+        _FileEmitter.begin(self, conference)
+        self._entries = {} # index_key: [sort_key, conf_ids]
+
+    def time_slot(self, day, time, sessions):
+        entries = self._entries
+        for values in sessions:
+            for c in values.session.contributions:
+                for author in c.author_entries:
+                    try:
+                        entry = entries[author.index_key]
+                    except KeyError:
+                        entry = entries[author.index_key] = [author.sort_key, []]
+                    if author.sort_key < entry[0]:
+                        entry[0] = author.sort_key
+                    if c.conf_id not in entry[1]:
+                        entry[1].append(c.conf_id)
+
+    def end(self):
+        f = self.file
+        f.write(u"\\begin{theindex}\n")
+        letter = None
+        for index_key, (sort_key, conf_ids) in sorted(self._entries.items(), key=lambda x: x[1][0]):
+            if sort_key[0][:1] != letter:
+                if letter is not None:
+                    f.write(u"\n  \\indexspace\n")
+                letter = sort_key[0][:1]
+                f.write(u"\n")
+            f.write(u"  \\item " + index_key + u", " + \
+                    u", ".join([tpl.authorindexref(x) for x in sorted(conf_ids)]) + u"\n")
+        f.write(u"\n\\end{theindex}\n")
+        f.close()
+
+
+def author_index(conference, filename):
+    # writes the author index (theindex environment) of all contributions
+    # The index lists for each author (index entry "<last name>, <initials>")
+    # the conference ids of the contributions, so no makeindex run is needed.
     # conference: conference_structure.Conference
+    render(conference, [AuthorIndexEmitter(filename)])
+
 
-    rooms = conference.get_all_rooms(noposter=True)
-    cmddict = {}
-    for dn, d in enumerate(conference.get_day_ids()):
-        day = u"day" + chr(65+dn)
-        cmddict[day] = conference.get_all_sessions_at_day(d)[0].weekday + ", " + \
-                        str(d) + " September 2017"
+class OverviewEmitter(_FileEmitter, Emitter):
+    # commands of the overview table (see overview_table_code)
 
+    header = u"%%%% OVERVIEW TABLE COMMANDS\n"
 
+    def __init__(self, filename):
+        self.filename = filename
+        self.file = None
+
+    def begin(self, conference):
+        _FileEmitter.begin(self, conference)
+        self.conference = conference
+        self.rooms = conference.get_all_rooms(noposter=True)
+        self.cmddict = {}
+        self._day_cnt = 0
+
+    def day_begin(self, d, weekday):
+        day = u"day" + chr(65 + self._day_cnt)
+        self._day = day
+        self._time_cnt = 0
+        self.cmddict[day] = weekday + ", " + str(d) + " September 2017"
 
         #set room and sessiona to NONE
-        for cnt, r in enumerate(rooms):
+        for cnt, r in enumerate(self.rooms):
             room = u"room" + chr(65 + cnt)
-            cmddict[day + room] = r
-            for tn, t in enumerate(conference.get_times(d)):
+            self.cmddict[day + room] = r
+            for tn, t in enumerate(self.conference.get_times(d)):
                 time = u"time" + chr(65 + tn)
-                cmddict[day + room + time] = ""
-
-        for tn, t in enumerate(conference.get_times(d)):
-            time = u"time" + chr(65 + tn)
-            end = conference.get_latest_end_time(d,t)
-            cmddict[day+time] = u"{0} -- {1}".format(t,end)
-            poster_rooms = u", ".join(conference.get_rooms(d, t))
-            x = poster_rooms.rfind(",")
-            poster_rooms = unicode_to_tex(poster_rooms[:x] + " &" + poster_rooms[(x+1):])
-            for r in conference.get_rooms(d, t):
-                session = conference.get_session(d, t, r)
-                if session.type == "poster":
-                    cmddict[day + "poster" + time] = "{ " + session.title[:session.title.find(" - ")].strip() + \
-                        "}\\par {\\itshape Rooms: " + poster_rooms + "}"
-                else:
-                    # shorten title with subtitle (: -)
-                    tmp = session.title
-                    x = max([tmp.find(":"), tmp.find(" - ")])
-                    if x>0:
-                        tmp = tmp[:x]
-                    if session.type == "symposium":
-                        tmp = u"(S) " + tmp
-                    tmp += u" \\par{{\\itshape ({} -- {})}}".format(session.smallest_conf_id, session.largets_conf_id)
-                    room = u"room" + chr(65 + rooms.index(session.room))
-                    cmddict[day + room + time] = tmp
-
-    # cmddict to text
-    txt = u"%%%% OVERVIEW TABLE COMMANDS\n"
-    txt += u"%% file: {} (sha1: {}) \n".format(conference.file,
-                                                conference.file_hash)
-    for k,v in cmddict.iteritems():
-        txt += u"\\newcommand{{\\{0}}}{{{1}}}\n".format(k,v)
-
-    print("writing: " + filename)
-    with open(filename, "wb") as f:
-       f.write(txt.encode("UTF-8"))
+                self.cmddict[day + room + time] = ""
+
+    def time_slot(self, d, t, sessions):
+        cmddict = self.cmddict
+        day = self._day
+        time = u"time" + chr(65 + self._time_cnt)
+        self._time_cnt += 1
+        end = self.conference.get_latest_end_time(d,t)
+        cmddict[day+time] = u"{0} -- {1}".format(t,end)
+        poster_rooms = u", ".join([x.session.room for x in sessions])
+        x = poster_rooms.rfind(",")
+        poster_rooms = unicode_to_tex(poster_rooms[:x] + " &" + poster_rooms[(x+1):])
+        for values in sessions:
+            session = values.session
+            if session.type == "poster":
+                cmddict[day + "poster" + time] = "{ " + session.title[:session.title.find(" - ")].strip() + \
+                    "}\\par {\\itshape Rooms: " + poster_rooms + "}"
+            else:
+                # shorten title with subtitle (: -)
+                tmp = session.title
+                x = max([tmp.find(":"), tmp.find(" - ")])
+                if x>0:
+                    tmp = tmp[:x]
+                if session.type == "symposium":
+                    tmp = u"(S) " + tmp
+                tmp += u" \\par{{\\itshape ({} -- {})}}".format(*session.conf_id_range)
+                room = u"room" + chr(65 + self.rooms.index(session.room))
+                cmddict[day + room + time] = tmp
+
+    def day_end(self, d):
+        self._day_cnt += 1
+
+    def end(self):
+        # cmddict to text
+        for k,v in self.cmddict.iteritems():
+            self.file.write(tpl.newcommand(u"\\" + k, v))
+        self.file.close()
+
+
+def overview_table_code(conference, filename):
+    # conference: conference_structure.Conference
+    render(conference, [OverviewEmitter(filename)])
@@ -1,12 +1,21 @@
-from time import gmtime, strftime, strptime
-from collections import OrderedDict
-from csv import DictReader
+import os
+import mmap
+import zlib
+import copy
+import cPickle
+from time import gmtime, strftime
+from datetime import date
+from collections import OrderedDict, namedtuple
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+from csv import DictReader, reader
 from hashlib import sha1
-from orderedset import OrderedSet
+from difflib import SequenceMatcher
+import re
 from unidecode import unidecode as remove_accents
 from titlecase import titlecase
 
-from unicode_tex import unicode_to_tex
+from unicode_tex import unicode_to_tex, tex_to_unicode
 
 # helper functions
 def unicode_list(txt, separator=","):
@@ -15,93 +24,459 @@ def unicode_list(txt, separator=","):
     return [x.strip() for x in lst]
 
 
+_interned = {}
+
+def intern_string(txt):
+    # returns a shared instance of an (unicode) string to avoid copies of
+    # repeated strings (rooms, chairs, names)
+    return _interned.setdefault(txt, txt)
+
+def unique(iterable):
+    # returns the elements of iterable as tuple without duplicates in order
+    # of first occurrence
+    seen = set()
+    return tuple([x for x in iterable if not (x in seen or seen.add(x))])
+
+
 def initials(name):
     # returns the initals of a name
     return ". ".join([x[0] for x in name.strip().split()]) + "."
 
+def needs_titlecase(textstring, percent_uppercase_threshold=75):
+    # True, if the string has no uppercase letters or more than
+    # percent_uppercase_threshold percent of the characters are uppercase
+    if textstring.islower():
+        return True # quick check: no uppercase letters
+    n_upper = sum(map(type(textstring).isupper, textstring))
+    return (n_upper==0) or (100*float(n_upper)/len(textstring))>percent_uppercase_threshold
+
+_titlecase_cache = {}
+
 def fix_uppercase(textstring, percent_uppercase_threshold=75):
     # converts string to titlecase (NY times style), if all
     #  (A) case are lower cases
     #  (B) x-% are in uppercase (see percent_uppercase_threshold)
+    return fix_uppercase_titles([textstring], percent_uppercase_threshold)[0]
+
+def fix_uppercase_titles(titles, percent_uppercase_threshold=75, processes=None,
+                         min_titles_per_process=500):
+    # fix_uppercase for a list of strings
+    # Results are cached by the raw string. If processes>1, titlecase will be
+    # applied in a pool of processes, but only if there are at least
+    # min_titles_per_process titles per process to convert.
+
+    key = percent_uppercase_threshold
+    todo = []
+    for x in titles:
+        if not _titlecase_cache.has_key((x, key)):
+            if needs_titlecase(x, percent_uppercase_threshold):
+                todo.append(x)
+            else:
+                _titlecase_cache[(x, key)] = x
+    todo = unique(todo)
 
-    n = len(textstring)
-    n_upper = sum([x.isupper() for x in textstring])
-    if (n_upper==0) or (100*float(n_upper)/n)>percent_uppercase_threshold:
-        return titlecase(textstring)
+    if processes is not None and processes > 1 and \
+            len(todo) >= 2 * min_titles_per_process:
+        pool = Pool(min(processes, len(todo) // min_titles_per_process))
+        try:
+            converted = pool.map(titlecase, todo, chunksize=min_titles_per_process // 4)
+        finally:
+            pool.close()
+            pool.join()
     else:
-        return textstring
+        converted = [titlecase(x) for x in todo]
+    for x, c in zip(todo, converted):
+        _titlecase_cache[(x, key)] = c
+
+    return [_titlecase_cache[(x, key)] for x in titles]
+
+_EPOCH_DAY = date(1970, 1, 1).toordinal()
+_timestamp_cache = {}
+
+def parse_timestamp(txt, cache_size=4096):
+    # parses a ConfTool timestamp ("%Y-%m-%d %H:%M") and returns the minutes
+    # since epoch (int). Raises ValueError for malformed timestamps.
+    # Results are memoized; the cache is emptied if it exceeds cache_size.
+
+    try:
+        return _timestamp_cache[txt]
+    except KeyError:
+        pass
+
+    if len(txt) != 16 or txt[4] != "-" or txt[7] != "-" or \
+            txt[10] != " " or txt[13] != ":" or \
+            not (txt[:4] + txt[5:7] + txt[8:10] + txt[11:13] + txt[14:16]).isdigit():
+        raise ValueError("invalid timestamp: '{}'".format(txt))
+    hour = int(txt[11:13])
+    minute = int(txt[14:16])
+    if hour > 23 or minute > 59:
+        raise ValueError("invalid timestamp: '{}'".format(txt))
+    days = date(int(txt[:4]), int(txt[5:7]), int(txt[8:10])).toordinal() - _EPOCH_DAY
+
+    if len(_timestamp_cache) >= cache_size:
+        _timestamp_cache.clear()
+    rtn = (days * 24 + hour) * 60 + minute
+    _timestamp_cache[txt] = rtn
+    return rtn
+
+def format_timestamp(minutes, fmt="%H:%M"):
+    # formats minutes since epoch (see parse_timestamp) with time.strftime
+    if fmt == "%H:%M":
+        return "%02d:%02d" % divmod(minutes % 1440, 60)
+    return strftime(fmt, gmtime(minutes * 60))
+
+def content_hash(fields):
+    # returns sha1 hash of a sequence of (utf-8 encoded) csv fields
+    return sha1("\x1f".join(fields)).hexdigest()
+
+FileHash = namedtuple("FileHash", ["filename", "hexdigest", "error"])
+
+def file_hash(filename, chunk_size=1024*1024, use_mmap=False):
+    """returns FileHash with the sha1 secure hash of the file
+
+    The file is read in chunks of chunk_size bytes or, if use_mmap, hashed
+    via a memory map. If the file can't be read, hexdigest is None and error
+    is the raised EnvironmentError.
+    """
+
+    h = sha1()
+    try:
+        with open(filename, 'rb') as f:
+            if use_mmap and os.fstat(f.fileno()).st_size > 0: # empty files can't be mapped
+                m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    for pos in xrange(0, len(m), chunk_size):
+                        h.update(m[pos:pos+chunk_size])
+                finally:
+                    m.close()
+            else:
+                for chunk in iter(lambda: f.read(chunk_size), b""):
+                    h.update(chunk)
+    except EnvironmentError as err:
+        return FileHash(filename, None, err)
+    return FileHash(filename, h.hexdigest(), None)
+
+def replace_file(src, dst):
+    # renames src to dst and replaces an existing dst. On POSIX os.rename
+    # replaces dst atomically, Windows requires to remove dst first.
+    if os.name == "nt" and os.path.exists(dst):
+        os.remove(dst)
+    os.rename(src, dst)
+
+def hash_files(filenames, threads=4, chunk_size=1024*1024, use_mmap=False):
+    """returns a list of FileHash for multiple files (see file_hash)
+
+    The files are hashed in parallel threads.
+    """
+
+    if threads <= 1 or len(filenames) <= 1:
+        return [file_hash(x, chunk_size, use_mmap) for x in filenames]
+    pool = ThreadPool(min(threads, len(filenames)))
+    try:
+        return pool.map(lambda x: file_hash(x, chunk_size, use_mmap), filenames)
+    finally:
+        pool.close()
 
 def secure_hash(filename):
     """returns sha1 secure hash from file or None, if not possile"""
-    try:
-        with open(filename) as f:
-            return sha1(f.read()).hexdigest()
-    except:
-        return None
+    return file_hash(filename).hexdigest
+
+def normalize_name(name):
+    # accent-free, lower case name with normalized whitespace (lookup key)
+    return u" ".join(remove_accents(name).lower().split())
+
+
+AuthorRecord = namedtuple("AuthorRecord", ["id", "name", "email", "organisations", "row"])
 
 class Authors():
+    """authors csv file with hash lookups by name, normalized name and email"""
+
+    name_field = "name"
+    email_field = "email"
+    organisation_field = "organisation"
 
     def __init__(self, authors_csv_file):
-        self.authors = []
+        self.authors = [] # csv rows
+        self.records = [] # AuthorRecords
         self.file = authors_csv_file
         self.file_hash = secure_hash(self.file)
+        self._by_name = {}
+        self._by_normalized_name = {}
+        self._by_email = {}
         with open(authors_csv_file, 'rb') as csvfile:
             for row in DictReader(csvfile, delimiter=',', quotechar='"'):
-                self.authors.append(row)
-        self.names = OrderedSet([unicode(x['name'], 'utf-8') for x in self.authors] )
+                self.add(row)
+        self.names = [x.name for x in self.records]
+
+    def add(self, row):
+        # adds a csv row (dict) and returns its AuthorRecord
+        # if names or emails occur multiple times, lookups return the first
+        # record
+
+        name = unicode(row[Authors.name_field], 'utf-8')
+        email = unicode(row.get(Authors.email_field) or "", 'utf-8').strip()
+        orga = row.get(Authors.organisation_field)
+        if orga is None:
+            orga = ()
+        else:
+            orga = tuple(unicode_list(orga, separator=";"))
+        record = AuthorRecord(id=len(self.records), name=name, email=email,
+                              organisations=orga, row=row)
+        self.authors.append(row)
+        self.records.append(record)
+
+        self._by_name.setdefault(name, record)
+        self._by_normalized_name.setdefault(normalize_name(name), record)
+        if len(email) > 0:
+            self._by_email.setdefault(email.lower(), record)
+        return record
+
+    def find(self, name=None, email=None):
+        # returns the AuthorRecord of an author or None, if not found
+        # lookup order: exact name, normalized name (see normalize_name), email
+
+        if name is not None:
+            rtn = self._by_name.get(name)
+            if rtn is None:
+                rtn = self._by_normalized_name.get(normalize_name(name))
+            if rtn is not None:
+                return rtn
+        if email is not None:
+            return self._by_email.get(email.strip().lower())
+        return None
 
     def get_field(self, author_name, field):
-        try:
-            id = self.names.index(author_name)
-        except:
+        record = self._by_name.get(author_name)
+        if record is None:
             return None
-        return self.authors[id][field]
+        return record.row[field]
 
     def get_organisations(self, author_name):
-        a = self.get_field(author_name, "organisation")
-        if a is None:
+        record = self._by_name.get(author_name)
+        if record is None or len(record.organisations) == 0:
             return None
         else:
-            return unicode_list(a, separator=";")
+            return list(record.organisations)
+
 
+_non_alphanumeric = re.compile(r"[\W_]+", re.UNICODE)
 
-class Contribution():
+def normalize_organisation(name):
+    # accent-free, lower case organisation name without punctuation and with
+    # normalized whitespace (key to identify spellings of the same organisation)
+    txt = _non_alphanumeric.sub(u" ", unicode(remove_accents(name)).lower())
+    return u" ".join(txt.split())
 
-    def __init__(self, authors, title, organizations, abstract, type, start, end, emails, fix_uppercase_title=True):
+
+class Affiliations(object):
+    """conference-wide index of organisations
+
+    Each organisation gets an integer id. Spellings with the same normalized
+    name (see normalize_organisation) get the same id; the first spelling is
+    used as name.
+    """
+
+    def __init__(self):
+        self.names = [] # name per id
+        self.keys = [] # normalized name per id
+        self._by_spelling = {}
+        self._by_key = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def get_id(self, name):
+        # returns the id of an organisation (adds new organisations)
+        try:
+            return self._by_spelling[name]
+        except KeyError:
+            pass
+        key = normalize_organisation(name)
+        rtn = self._by_key.get(key)
+        if rtn is None:
+            rtn = len(self.names)
+            self.names.append(name)
+            self.keys.append(key)
+            self._by_key[key] = rtn
+        self._by_spelling[name] = rtn
+        return rtn
+
+    def name(self, id):
+        return self.names[id]
+
+    def spellings(self, id):
+        # all spellings of an organisation
+        return [k for k, v in self._by_spelling.items() if v == id]
+
+    def near_duplicates(self, min_ratio=0.9, max_block_size=100, window=10):
+        # returns list of (id, id, similarity ratio) of organisations with
+        # similar normalized names (e.g. typos)
+        # Only organisations that share a word (blocking) are compared.
+        # Words that occur in more than max_block_size organisations (e.g.
+        # "university") are not used for blocking. Within a block, the names
+        # are sorted and each name is only compared with the next window
+        # names, so the number of comparisons is at most
+        # window * len(self) * <words per name>.
+
+        blocks = {}
+        for id, key in enumerate(self.keys):
+            for word in set(key.split()):
+                if len(word) > 2:
+                    blocks.setdefault(word, []).append(id)
+
+        rtn = []
+        compared = set()
+        for ids in blocks.values():
+            if len(ids) < 2 or len(ids) > max_block_size:
+                continue
+            ids = sorted(ids, key=lambda x: self.keys[x])
+            for cnt, a in enumerate(ids):
+                key_a = self.keys[a]
+                matcher = None # SequenceMatcher caches information about seq2
+                for b in ids[cnt+1:cnt+1+window]:
+                    pair = (min(a, b), max(a, b))
+                    if pair in compared:
+                        continue
+                    compared.add(pair)
+                    key_b = self.keys[b]
+                    # upper bound of the ratio
+                    if 2.0 * min(len(key_a), len(key_b)) / (len(key_a) + len(key_b)) < min_ratio:
+                        continue
+                    if matcher is None:
+                        matcher = SequenceMatcher(None, b=key_a)
+                    matcher.set_seq1(key_b)
+                    if matcher.quick_ratio() >= min_ratio:
+                        ratio = matcher.ratio()
+                        if ratio >= min_ratio:
+                            rtn.append(pair + (ratio,))
+        return sorted(rtn)
+
+
+class Author(object):
+    """author of contributions with precomputed names and index keys
+
+    names and tex_names: (last name, last name with initials, full name)
+    """
+
+    __slots__ = ("last_name", "first_name", "names", "tex_names",
+                 "index_key", "sort_key")
+
+    def __init__(self, last_name, first_name):
+        self.last_name = last_name
+        self.first_name = first_name
+        short_name = last_name + ", " + initials(first_name)
+        self.names = (last_name, short_name, first_name + " " + last_name)
+        self.tex_names = tuple([unicode_to_tex(x) for x in self.names])
+        self.index_key = unicode_to_tex(remove_accents(short_name))
+        self.sort_key = (normalize_name(last_name), normalize_name(first_name),
+                         last_name, first_name)
+
+    @property
+    def index_entry(self):
+        return u"\\index{" + self.index_key + u"}"
+
+
+class AuthorRegistry(object):
+    """conference-wide registry of the authors (see Author)"""
+
+    def __init__(self):
+        self._authors = {}
+
+    def __len__(self):
+        return len(self._authors)
+
+    def get(self, last_name, first_name):
+        # returns the Author (adds new authors)
+        key = (last_name, first_name)
+        try:
+            return self._authors[key]
+        except KeyError:
+            rtn = Author(intern_string(last_name), intern_string(first_name))
+            self._authors[key] = rtn
+            return rtn
+
+    def register(self, author):
+        # returns the registered Author of the same name (adds author, if new)
+        return self._authors.setdefault((author.last_name, author.first_name), author)
+
+    def sorted_authors(self):
+        # all authors sorted by their sort_key
+        return sorted(self._authors.values(), key=lambda x: x.sort_key)
+
+
+_tex_separators = {u", ": unicode_to_tex(u", "), u" & ": unicode_to_tex(u" & ")}
+
+class Contribution(object):
+
+    __slots__ = ("content_hash", "authors", "author_records", "title", "abstract",
+                 "type", "start", "end", "emails", "affiliations",
+                 "organisation_ids", "unique_organisation_ids", "author_entries",
+                 "affiliation_ids", "conf_id")
+
+    def __init__(self, authors, title, organizations, abstract, type, start, end, emails, fix_uppercase_title=True,
+                 content_hash=None, affiliations=None, author_registry=None):
         # organisations for each author len(authors)==len(organizations)
         # multiple organisation of one authors are seperated by ";"
-        # start ,end: time.struct_time
-
-        self.authors = authors
+        # start ,end: minutes since epoch (see parse_timestamp)
+        # content_hash: hash of the raw csv fields of the contribution
+        # affiliations: Affiliations index of the conference, the contribution
+        #               stores only the ids of the organisations
+        # author_registry: AuthorRegistry of the conference
+
+        self.content_hash = content_hash
+        self.authors = tuple(authors)
+        self.author_records = None # AuthorRecord per author, see Conference.join_authors
         self.title = title
         self.abstract = abstract
         self.type = type
         self.start = start
         self.end = end
-        self.emails = emails
+        self.emails = tuple(emails)
 
         if fix_uppercase_title:
             self.title = fix_uppercase(self.title)
 
-        # find all organizations
-        self.unique_organisations = []
-        self.organisations = []
-        for orga in organizations:
-            tmp = [x.strip() for x in orga.split(";")]
-            self.organisations.append(tmp)
-            self.unique_organisations.extend(tmp)
-        self.unique_organisations = OrderedSet(self.unique_organisations)
-
-        self.first_names = []
-        self.last_names = []
-        self.affiliation_ids = []
-        for aut, orga in zip(self.authors, self.organisations):
+        if author_registry is None:
+            author_registry = AuthorRegistry()
+        author_entries = []
+        for aut in self.authors:
             last, first = aut.title().split(",")
-            self.last_names.append(last.strip())
-            self.first_names.append(first.strip())
+            author_entries.append(author_registry.get(last.strip(), first.strip()))
+        self.author_entries = tuple(author_entries)
+
+        if affiliations is None:
+            affiliations = Affiliations()
+        self.set_organisations(organizations, affiliations)
+
+    def set_organisations(self, organizations, affiliations):
+        # stores the ids of the organisations in the Affiliations index
+        # organizations: organisations for each author, multiple organisation
+        #                of one authors are seperated by ";"
+        self.affiliations = affiliations
+        # spelling variants of an organisation share the id, keep it once
+        self.organisation_ids = tuple([unique([affiliations.get_id(x.strip()) for x in orga.split(";")])
+                                       for orga in organizations])
+        self.unique_organisation_ids = unique([o for orga in self.organisation_ids for o in orga])
+        self.affiliation_ids = tuple([tuple([self.unique_organisation_ids.index(o)+1 for o in orga])
+                                      for orga in self.organisation_ids[:len(self.authors)]])
+
+    @property
+    def first_names(self):
+        return tuple([x.first_name for x in self.author_entries])
 
-            idx = [self.unique_organisations.index(o)+1 for o in orga]
-            self.affiliation_ids.append(idx)
+    @property
+    def last_names(self):
+        return tuple([x.last_name for x in self.author_entries])
+
+    @property
+    def organisations(self):
+        # organisations of each author
+        return tuple([tuple([self.affiliations.name(x) for x in orga])
+                      for orga in self.organisation_ids])
+
+    @property
+    def unique_organisations(self):
+        return tuple([self.affiliations.name(x) for x in self.unique_organisation_ids])
 
 
     def formated_authors(self, fullnames=False, first_name_initials=False,
@@ -110,42 +485,38 @@ class Contribution():
         # tex_code=True: convert all unicode strings to text code, except keep untouched "orga_id_format"
         # write_index: add index code (has only an effect if tex_code=True)
 
+        if fullnames:
+            variant = 2
+        elif first_name_initials:
+            variant = 1
+        else:
+            variant = 0
+
         if len(self.authors) == 1:
-            if fullnames:
-                rtn = self.first_names[0] + " " + self.last_names[0]
-            else:
-                rtn = self.last_names[0]
-                if first_name_initials:
-                    rtn += ", " + initials(self.first_names[0])
+            author = self.author_entries[0]
             if tex_code:
-                rtn = unicode_to_tex(rtn)
+                rtn = author.tex_names[variant]
                 if write_index:
-                    rtn += u"\\index{" + unicode_to_tex(remove_accents(self.last_names[0] + ", "
-                                                                       + initials(self.first_names[0]))) + u"}"
+                    rtn += author.index_entry
+            else:
+                rtn = author.names[variant]
             return rtn
 
         else:
             rtn = u""
             sep = u", "
-            for cnt, last_name in enumerate(self.last_names):
-                if cnt == len(self.last_names)-1:
+            for cnt, author in enumerate(self.author_entries):
+                if cnt == len(self.author_entries)-1:
                     sep = u" & "
 
-                if fullnames:
-                    name = sep + self.first_names[cnt] + " " + last_name
-                else:
-                    name = sep + last_name
-                    if first_name_initials:
-                        name += ", " + initials(self.first_names[cnt])
                 if tex_code:
-                    rtn += unicode_to_tex(name)
+                    rtn += _tex_separators[sep] + author.tex_names[variant]
                     if write_index:
-                        rtn += u"\\index{" + unicode_to_tex(remove_accents(last_name + ", "
-                                                                           + initials(self.first_names[cnt]))) + u"}"
+                        rtn += author.index_entry
                 else:
-                    rtn += name
-                if affiliation_ids and len(self.unique_organisations)>1:
-                    rtn += orga_id_format.format(unicode(self.affiliation_ids[cnt])[1:-1])
+                    rtn += sep + author.names[variant]
+                if affiliation_ids and len(self.unique_organisation_ids)>1:
+                    rtn += orga_id_format.format(u", ".join([unicode(x) for x in self.affiliation_ids[cnt]]))
 
             return rtn[2:]
 
@@ -168,7 +539,7 @@ class Contribution():
 
     @property
     def first_author_lastname(self):
-        return self.last_names[0]
+        return self.author_entries[0].last_name
 
     @property
     def first_author_email(self):
@@ -176,33 +547,76 @@ class Contribution():
 
     @property
     def start_str(self):
-        return strftime("%H:%M", self.start)
+        return format_timestamp(self.start)
 
     @property
     def start_str_long(self):
-        return strftime("%d %b %Y %H:%M", self.start)
+        return format_timestamp(self.start, "%d %b %Y %H:%M")
 
     @property
     def end_str(self):
-        return strftime("%H:%M", self.end)
+        return format_timestamp(self.end)
+
+
+class ColumnMap():
+    """column plan of a ConfTool sessions csv file
+
+    The header is parsed once per file. Rows can then be read positionally.
+    """
 
+    session_fields = ('session_start', 'session_end', 'session_room',
+                      'chair1', 'session_title', 'session_short')
+    contribution_fields = ('title', 'authors', 'emails', 'organisations',
+                           'abstract', 'start', 'end')
 
-class Session():
+    def __init__(self, header):
+        # header: first row of the csv file
 
-    def __init__(self, entry_dict, max_contributions=80):
-        # entry_dict: entry from csv file DictReader
+        pos = dict((name, cnt) for cnt, name in enumerate(header))
+        self.session = tuple([pos[x] for x in ColumnMap.session_fields])
 
-        self.dict = entry_dict
-        self.start = strptime(self.dict['session_start'], "%Y-%m-%d %H:%M")
-        self.end = strptime(self.dict['session_end'], "%Y-%m-%d %H:%M")
-        self.room =  self.dict['session_room']
-        self.chair = unicode(entry_dict['chair1'], 'utf-8').strip()
+        # one tuple of column indices per contribution slot (p1_*, p2_*, ...)
+        self.slots = []
+        x = 1
+        while pos.has_key('p{}_title'.format(x)):
+            self.slots.append(tuple([pos['p{}_{}'.format(x, f)]
+                                     for f in ColumnMap.contribution_fields]))
+            x += 1
+        self.slots = tuple(self.slots)
+
+    @property
+    def max_contributions(self):
+        return len(self.slots)
+
+
+class Session(object):
+
+    __slots__ = ("content_hash", "start", "end", "room", "chair", "title",
+                 "symposium__organizer", "type", "contributions", "conf_id_range")
+
+    def __init__(self, row, columns, row_hash=None, fix_uppercase_titles=True,
+                 affiliations=None, author_registry=None):
+        # row: entry from csv file reader (list)
+        # columns: ColumnMap of the csv file
+        # row_hash: content_hash(row), if already known
+        # fix_uppercase_titles: fix_uppercase of contribution titles
+        # affiliations: Affiliations index for the organisations
+        # author_registry: AuthorRegistry for the authors
+
+        if row_hash is None:
+            row_hash = content_hash(row)
+        self.content_hash = row_hash
+        i_start, i_end, i_room, i_chair, i_title, i_short = columns.session
+        self.start = parse_timestamp(row[i_start])
+        self.end = parse_timestamp(row[i_end])
+        self.room = intern_string(row[i_room])
+        self.chair = intern_string(unicode(row[i_chair], 'utf-8').strip())
 
         # symposia have the organizior in title [title (organizor)]
-        self.title = unicode(entry_dict['session_title'].strip(), 'utf-8')
+        self.title = unicode(row[i_title].strip(), 'utf-8')
         self.symposium__organizer = None
         self.type = None
-        if entry_dict['session_short'].startswith("Pos"):
+        if row[i_short].startswith("Pos"):
             self.type = "poster"
         else:
             self.type = "oral"
@@ -212,93 +626,315 @@ class Session():
                 self.title = self.title[:idx].strip()
                 self.type = "symposium"
 
-        self.contributions = []
-        for x in xrange(1, max_contributions):
-            title = unicode(entry_dict['p{}_title'.format(x)], 'utf-8')
+        if affiliations is None:
+            affiliations = Affiliations()
+        if author_registry is None:
+            author_registry = AuthorRegistry()
+        contributions = []
+        for slot in columns.slots:
+            i_title, i_authors, i_emails, i_orga, i_abstract, i_start, i_end = slot
+            title = unicode(row[i_title], 'utf-8')
             if len(title)!=0:
-                authors = unicode_list(entry_dict['p{}_authors'.format(x)], separator="\n")
-                emails = unicode_list(entry_dict['p{}_emails'.format(x)], separator="\n")
-                organizations = unicode_list(entry_dict['p{}_organisations'.format(x)], separator="\n")
-                abstract = unicode(entry_dict['p{}_abstract'.format(x)], 'utf-8')
+                authors = unicode_list(row[i_authors], separator="\n")
+                emails = unicode_list(row[i_emails], separator="\n")
+                organizations = unicode_list(row[i_orga], separator="\n")
+                abstract = tex_to_unicode(unicode(row[i_abstract], 'utf-8')) # pasted latex code
                 try:
-                    start = strptime(entry_dict['p{}_start'.format(x)], "%Y-%m-%d %H:%M")
-                    end = strptime(entry_dict['p{}_end'.format(x)], "%Y-%m-%d %H:%M")
-                except:
+                    start = parse_timestamp(row[i_start])
+                    end = parse_timestamp(row[i_end])
+                except ValueError:
                     start = None
                     end = None
-                self.contributions.append(Contribution(authors=authors,
-                                                       title=title,
-                                                       organizations=organizations,
-                                                       abstract=abstract,
-                                                       type=self.type,
-                                                       start=start,
-                                                       end=end,
-                                                       emails=emails)) #TODO
+                contributions.append(Contribution(authors=authors,
+                                                  title=title,
+                                                  organizations=organizations,
+                                                  abstract=abstract,
+                                                  type=self.type,
+                                                  start=start,
+                                                  end=end,
+                                                  emails=emails,
+                                                  fix_uppercase_title=fix_uppercase_titles,
+                                                  affiliations=affiliations,
+                                                  author_registry=author_registry,
+                                                  content_hash=content_hash([row[i] for i in slot]))) #TODO
 
             else:
                 break # empty tile --> last talk of session
 
         # sort contribution by time
-        self.contributions.sort(key=lambda x: x.start, reverse=False)
+        contributions.sort(key=lambda x: x.start, reverse=False)
+        self.contributions = tuple(contributions)
+        # (smallest, largest) conference id, set by Conference.finalize
+        self.conf_id_range = (None, None)
+
+    def copy_with_affiliations(self, row, columns, affiliations, author_registry):
+        # returns a copy of the session (and its contributions), in which the
+        # organisations refer to the Affiliations index affiliations and the
+        # authors are registered in author_registry
+        # row, columns: csv row of the session (see __init__)
+        # The organisations are registered in the order of the csv row as in
+        # __init__, so the index equals the index of newly built sessions.
+
+        contributions = [copy.copy(c) for c in self.contributions]
+        by_hash = {}
+        for c in contributions:
+            by_hash.setdefault(c.content_hash, []).append(c)
+        for slot in columns.slots:
+            i_title, i_authors, i_emails, i_orga, i_abstract, i_start, i_end = slot
+            if len(row[i_title])!=0:
+                c = by_hash[content_hash([row[i] for i in slot])].pop(0)
+                c.set_organisations(unicode_list(row[i_orga], separator="\n"), affiliations)
+                c.author_entries = tuple([author_registry.register(a)
+                                          for a in c.author_entries])
+            else:
+                break # empty tile --> last talk of session
+
+        rtn = copy.copy(self)
+        rtn.contributions = tuple(contributions)
+        return rtn
 
 
     @property
     def start_str(self):
-        return strftime("%H:%M", self.start)
+        return format_timestamp(self.start)
 
     @property
     def end_str(self):
-        return strftime("%H:%M", self.end)
+        return format_timestamp(self.end)
 
     @property
     def day(self):
-        return strftime("%d", self.start)
+        return format_timestamp(self.start, "%d")
 
     @property
     def weekday(self):
-        return strftime("%A", self.start)
+        return format_timestamp(self.start, "%A")
 
     @property
     def smallest_conf_id(self):
-        try:
-            return min([x.conf_id for x in self.contributions])
-        except:
-            return None
+        return self.conf_id_range[0]
 
     @property
     def largets_conf_id(self):
-        try:
-            return max([x.conf_id for x in self.contributions])
-        except:
-            return None
+        return self.conf_id_range[1]
 
 
 
 # ============================================
 
+SNAPSHOT_VERSION = 11 # increment, if the structure of the classes changes
+
 class Conference():
     """basically a ordered dict{day} of dict{time} of dict{room} all sessions"""
 
-    def __init__(self, sessions_csv):
-        s_dict = {}
-        print("processing: " + sessions_csv)
+    def __init__(self, sessions_csv=None, sessions=None, previous=None, processes=None):
+        # sessions_csv: ConfTool sessions export
+        # sessions: alternatively, an iterable of Session objects (e.g. the
+        #           generator Conference.iter_sessions())
+        #           The organisations and authors of all sessions are stored in
+        #           self.affiliations and self.author_registry (only if read
+        #           from sessions_csv).
+        # previous: Conference of a previous export of the csv file (e.g. a
+        #           snapshot). Unchanged sessions will be taken from previous
+        #           instead of being rebuilt and self.changes is the
+        #           ConferenceDiff to previous.
+        #           Note: the reused Sessions and Contributions are copies,
+        #           but they share the other objects (e.g. Author) with
+        #           previous. previous is not changed.
+        # processes: number of processes for fixing the contribution titles
+        #           (see fix_uppercase_titles)
+
+        self._session_dict = {}
         self.file = sessions_csv
-        self.file_hash = secure_hash(self.file)
-        with open(sessions_csv, 'rb') as csvfile:
-            for row in DictReader(csvfile, delimiter=',', quotechar='"'):
-                session = Session(entry_dict=row)
-                day = session.day
-                if not s_dict.has_key(day):
-                    s_dict[day] = {}
-                if not s_dict[day].has_key(session.start_str):
-                    s_dict[day][session.start_str] = {}
-                if s_dict[day][session.start_str].has_key(session.room):
-                    raise RuntimeError("TIME CONFLICT")
+        self.file_hash = None
+        self.changes = None
+        # the Affiliations index and the AuthorRegistry are built from this
+        # export only (the names of the organisations are the first spellings
+        # in the export)
+        self.affiliations = Affiliations()
+        self.author_registry = AuthorRegistry()
+        if sessions_csv is not None:
+            print("processing: " + sessions_csv)
+            self.file_hash = secure_hash(self.file)
+            if previous is None:
+                reused = set()
+            else:
+                reused = set([x.content_hash for x in previous.get_all_sessions()])
+            new_contributions = []
+            for session in Conference.iter_sessions(sessions_csv, previous=previous,
+                                                    fix_uppercase_titles=False,
+                                                    affiliations=self.affiliations,
+                                                    author_registry=self.author_registry):
+                self.add_session(session)
+                if session.content_hash not in reused:
+                    new_contributions.extend(session.contributions)
+            # fix all titles at once
+            titles = fix_uppercase_titles([x.title for x in new_contributions],
+                                          processes=processes)
+            for c, title in zip(new_contributions, titles):
+                c.title = title
+
+        if sessions is not None:
+            for session in sessions:
+                self.add_session(session)
+        self.finalize()
+        if previous is not None:
+            self.changes = self.diff(previous)
+
+    @staticmethod
+    def load(sessions_csv, cache_dir=".conference_cache", processes=None):
+        # returns the Conference of a sessions csv file
+        # If the file has been parsed before, the conference will be loaded
+        # from a snapshot in cache_dir (cache key: secure_hash of the file).
+        # Otherwise, the csv file will be parsed and a snapshot will be saved.
+
+        file_hash = secure_hash(sessions_csv)
+        if file_hash is not None and cache_dir is not None:
+            conference = Conference.load_snapshot(
+                            Conference.snapshot_filename(file_hash, cache_dir))
+            if conference is not None:
+                print("loading snapshot: " + sessions_csv)
+                conference.file = sessions_csv
+                return conference
+
+        previous = None
+        if cache_dir is not None:
+            previous = Conference.load_snapshot(Conference.latest_snapshot_filename(cache_dir))
+        conference = Conference(sessions_csv, previous=previous, processes=processes)
+        if conference.changes is not None:
+            print(conference.changes)
+        if conference.file_hash is not None and cache_dir is not None:
+            conference.save_snapshot(cache_dir)
+        return conference
+
+    @staticmethod
+    def snapshot_filename(file_hash, cache_dir):
+        return os.path.join(cache_dir, "conference-{}-v{}.snapshot".format(
+                                            file_hash, SNAPSHOT_VERSION))
+
+    @staticmethod
+    def latest_snapshot_filename(cache_dir):
+        # returns the most recently saved snapshot file in cache_dir or None
+        try:
+            filenames = [os.path.join(cache_dir, x) for x in os.listdir(cache_dir)
+                         if x.endswith("-v{}.snapshot".format(SNAPSHOT_VERSION))]
+        except OSError:
+            return None
+        if len(filenames) == 0:
+            return None
+        return max(filenames, key=os.path.getmtime)
+
+    @staticmethod
+    def load_snapshot(filename):
+        # returns the Conference stored in a snapshot file or None, if not
+        # possible
+        if filename is None:
+            return None
+        try:
+            with open(filename, 'rb') as f:
+                return cPickle.loads(zlib.decompress(f.read()))
+        except Exception:
+            return None
 
-                s_dict[day][session.start_str][session.room] = session
+    def save_snapshot(self, cache_dir, max_snapshots=3):
+        # writes a compressed snapshot of the conference to the cache_dir
+        # and returns the filename
+        # Only the max_snapshots most recent snapshots are kept (see
+        # prune_snapshots).
+
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        filename = Conference.snapshot_filename(self.file_hash, cache_dir)
+        tmp_filename = filename + ".tmp"
+        with open(tmp_filename, 'wb') as f:
+            f.write(zlib.compress(cPickle.dumps(self, cPickle.HIGHEST_PROTOCOL)))
+        replace_file(tmp_filename, filename)
+        Conference.prune_snapshots(cache_dir, max_snapshots, keep=filename)
+        return filename
+
+    @staticmethod
+    def prune_snapshots(cache_dir, max_snapshots, keep=None):
+        # removes the snapshots of other SNAPSHOT_VERSIONs and all but the
+        # max_snapshots most recent snapshots in cache_dir
+        # keep: snapshot file that is never removed
+        try:
+            filenames = [os.path.join(cache_dir, x) for x in os.listdir(cache_dir)
+                         if x.startswith("conference-") and x.endswith(".snapshot")]
+        except OSError:
+            return
+        current = []
+        for x in filenames:
+            if x == keep:
+                continue
+            if x.endswith("-v{}.snapshot".format(SNAPSHOT_VERSION)):
+                current.append(x)
+            else:
+                os.remove(x) # old version
+        if keep is not None:
+            max_snapshots -= 1
+        current.sort(key=os.path.getmtime, reverse=True)
+        for x in current[max(max_snapshots, 0):]:
+            os.remove(x)
+
+    @staticmethod
+    def iter_sessions(sessions_csv, previous=None, fix_uppercase_titles=True,
+                      affiliations=None, author_registry=None):
+        # generator: yields the sessions of a ConfTool csv file one at a time
+        # previous: Conference, sessions with unchanged csv rows will be
+        #           taken from previous and not rebuilt
+        # fix_uppercase_titles: fix_uppercase of contribution titles (only
+        #           for newly built sessions)
+        # affiliations, author_registry: Affiliations index and AuthorRegistry
+        #           shared by all sessions. Reused sessions are copied and
+        #           refer to affiliations and author_registry.
+
+        if affiliations is None:
+            affiliations = Affiliations()
+        if author_registry is None:
+            author_registry = AuthorRegistry()
+
+        if previous is None:
+            known = {}
+        else:
+            known = dict([(x.content_hash, x) for x in previous.get_all_sessions()])
+
+        with open(sessions_csv, 'rb') as csvfile:
+            rows = reader(csvfile, delimiter=',', quotechar='"')
+            columns = ColumnMap(next(rows))
+            for row in rows:
+                if len(row) == 0:
+                    continue # empty line
+                row_hash = content_hash(row)
+                session = known.get(row_hash)
+                if session is not None:
+                    session = session.copy_with_affiliations(row, columns, affiliations,
+                                                             author_registry)
+                else:
+                    session = Session(row=row, columns=columns, row_hash=row_hash,
+                                      fix_uppercase_titles=fix_uppercase_titles,
+                                      affiliations=affiliations,
+                                      author_registry=author_registry)
+                yield session
+
+    def add_session(self, session):
+        s_dict = self._session_dict
+        day = session.day
+        if not s_dict.has_key(day):
+            s_dict[day] = {}
+        if not s_dict[day].has_key(session.start_str):
+            s_dict[day][session.start_str] = {}
+        if s_dict[day][session.start_str].has_key(session.room):
+            raise RuntimeError("TIME CONFLICT")
+
+        s_dict[day][session.start_str][session.room] = session
+
+    def finalize(self):
+        # sorts the sessions, (re)assigns the conference ids and builds the
+        # indexes of the query methods
+        # call this after adding sessions
 
         ## sort dict
-        s_dict = OrderedDict(sorted(s_dict.items())) # sort days
+        s_dict = OrderedDict(sorted(self._session_dict.items())) # sort days
         for x in s_dict.keys():
             s_dict[x] = OrderedDict(sorted(s_dict[x].items())) # sort time
             for y in s_dict[x]:
@@ -307,13 +943,13 @@ class Conference():
         self._session_dict = s_dict
 
         ## make_conference_ids
+        self._contributions = {} # conf_id: contribution
         poster_cnt = 0
         talk_cnt = 0
-        for d in self.get_day_ids():
+        for d in s_dict:
             poster_cnt += ((talk_cnt/1000)+1)*1000
-            for t in self.get_times(d):
-                for r in self.get_rooms(d, t):
-                    session = self.get_session(d,t,r)
+            for t in s_dict[d]:
+                for session in s_dict[d][t].itervalues():
                     for x in session.contributions:
                         if session.type=="poster":
                             poster_cnt += 1
@@ -321,15 +957,56 @@ class Conference():
                         else:
                             talk_cnt += 1
                             x.conf_id = talk_cnt
+                        if x.conf_id in self._contributions:
+                            # e.g. more than 1000 talks before the posters of a day
+                            raise RuntimeError("CONF ID CONFLICT: {0}".format(x.conf_id))
+                        self._contributions[x.conf_id] = x
+                    if len(session.contributions) > 0:
+                        session.conf_id_range = (session.contributions[0].conf_id,
+                                                 session.contributions[-1].conf_id)
+                    else:
+                        session.conf_id_range = (None, None)
+
+        self._build_indexes()
+
+    def _build_indexes(self):
+        # immutable indexes of the sorted sessions for the query methods
+        s_dict = self._session_dict
+        self._day_ids = tuple(s_dict.keys())
+        self._times = {}
+        self._rooms = {}
+        self._latest_end = {}
+        self._sessions = []
+        self._sessions_at_day = {}
+        self._talks_at_day = {}
+        for d in s_dict:
+            self._times[d] = tuple(s_dict[d].keys())
+            day_sessions = []
+            for t in s_dict[d]:
+                self._rooms[(d, t)] = tuple(s_dict[d][t].keys())
+                sessions = s_dict[d][t].values()
+                self._latest_end[(d, t)] = format_timestamp(max([x.end for x in sessions]))
+                day_sessions.extend(sessions)
+            self._sessions.extend(day_sessions)
+            day_sessions.sort(key=lambda x: x.conf_id_range[0]) # stable
+            self._sessions_at_day[d] = tuple(day_sessions)
+            self._talks_at_day[d] = tuple([x for x in day_sessions if x.type!="poster"])
+        self._sessions = tuple(self._sessions)
+        self._all_rooms = {}
+        for noposter, index in ((False, self._sessions_at_day), (True, self._talks_at_day)):
+            rooms = set()
+            for sessions in index.itervalues():
+                rooms.update([x.room for x in sessions])
+            self._all_rooms[noposter] = tuple(sorted(rooms))
 
     def get_day_ids(self):
-        return self._session_dict.keys()
+        return self._day_ids
 
     def get_times(self, day):
-        return self._session_dict[day].keys()
+        return self._times[day]
 
     def get_rooms(self, day, time):
-        return self._session_dict[day][time].keys()
+        return self._rooms[(day, time)]
 
     def get_session(self, day, time, room):
         try:
@@ -338,27 +1015,113 @@ class Conference():
             return None
 
     def get_latest_end_time(self, day, time):
-        latest_end = gmtime(0)
-        for session in self._session_dict[day][time].values():
-            if latest_end < session.end:
-                latest_end = session.end
-        return strftime("%H:%M", latest_end)
+        return self._latest_end[(day, time)]
+
+    def get_conf_id_range(self, day, time, room):
+        # (smallest, largest) conference id of a session, (None, None) for
+        # sessions without contributions
+        return self._session_dict[day][time][room].conf_id_range
+
+    def get_contribution(self, conf_id):
+        # returns the contribution with the conference id or None
+        return self._contributions.get(conf_id)
+
+    def get_all_sessions(self):
+        # all sessions sorted by day, time and room
+        return self._sessions
+
+    def join_authors(self, authors):
+        # attaches the AuthorRecords of the Authors table to all contributions
+        # (Contribution.author_records, None for unknown authors) and returns
+        # the list of unmatched author names
+        # Each distinct name is looked up only once. Authors without matching
+        # name are looked up by the email of the contribution.
+
+        lookup = {}
+        unmatched = []
+        unmatched_set = set()
+        for session in self.get_all_sessions():
+            for c in session.contributions:
+                records = []
+                for cnt, name in enumerate(c.authors):
+                    try:
+                        rec = lookup[name]
+                    except KeyError:
+                        rec = authors.find(name=name)
+                        lookup[name] = rec
+                    if rec is None and cnt < len(c.emails) and len(c.emails[cnt]) > 0:
+                        rec = authors.find(email=c.emails[cnt])
+                    if rec is None and name not in unmatched_set:
+                        unmatched_set.add(name)
+                        unmatched.append(name)
+                    records.append(rec)
+                c.author_records = tuple(records)
+        return unmatched
+
+    def diff(self, previous):
+        # returns ConferenceDiff between previous and this conference
+        return ConferenceDiff(previous, self)
 
     def get_all_sessions_at_day(self, day, noposter=False):
-        rtn = []
-        for time in self.get_times(day):
-            rtn.extend(self._session_dict[day][time].values())
-
-        rtn.sort(key=lambda x: x.smallest_conf_id)
+        # sessions of a day sorted by conference id
         if noposter:
-            rtn = filter(lambda x: x.type!="poster", rtn)
+            return self._talks_at_day[day]
+        return self._sessions_at_day[day]
 
+    def get_all_rooms(self, noposter=True):
+        # all rooms at the conference (sorted)
+        return self._all_rooms[noposter]
+
+
+
+class ConferenceDiff():
+    """changes between two versions of a conference
+
+    Sessions are identified by the key (day, time, room) and compared by
+    their content_hash.
+    """
+
+    def __init__(self, old, new):
+        # old, new: Conference
+
+        old_sessions = self._session_keys(old)
+        new_sessions = self._session_keys(new)
+
+        self.added = [k for k in new_sessions if not old_sessions.has_key(k)]
+        self.removed = [k for k in old_sessions if not new_sessions.has_key(k)]
+        self.modified = [k for k in new_sessions if old_sessions.has_key(k) and
+                         old_sessions[k].content_hash != new_sessions[k].content_hash]
+        self.unchanged = [k for k in new_sessions if old_sessions.has_key(k) and
+                          old_sessions[k].content_hash == new_sessions[k].content_hash]
+
+        # contributions of added and modified sessions, which are not
+        # part of the old conference
+        old_contributions = set()
+        for session in old_sessions.values():
+            old_contributions.update([x.content_hash for x in session.contributions])
+        self.changed_contributions = []
+        for k in self.added + self.modified:
+            self.changed_contributions.extend([x for x in new_sessions[k].contributions
+                                               if x.content_hash not in old_contributions])
+
+    @staticmethod
+    def _session_keys(conference):
+        rtn = OrderedDict()
+        for d in conference.get_day_ids():
+            for t in conference.get_times(d):
+                for r in conference.get_rooms(d, t):
+                    rtn[(d, t, r)] = conference.get_session(d, t, r)
         return rtn
 
-    def get_all_rooms(self, noposter=True):
-        # all rooms at the conference
-        rtn = []
-        for d in self.get_day_ids():
-            rtn.extend([x.room for x in self.get_all_sessions_at_day(d, noposter)])
-        return sorted(list(set(rtn)))
+    @property
+    def changed_sessions(self):
+        # keys of all added and modified sessions
+        return self.added + self.modified
+
+    def __len__(self):
+        return len(self.added) + len(self.removed) + len(self.modified)
 
+    def __str__(self):
+        return "changes: {} added, {} removed, {} modified sessions ({} contributions)".format(
+                    len(self.added), len(self.removed), len(self.modified),
+                    len(self.changed_contributions))
@@ -0,0 +1,108 @@
+'''
+Module tex_templates declares the LaTeX macros of the program booklet.
+
+Each macro call is declared once as MacroTemplate with the escaping rule
+of its arguments (TEX: text is converted with unicode_to_tex, RAW: tex
+code is inserted unchanged). The template is compiled into a format
+string, so formatting a macro call is a single call:
+
+    tex_templates.talkshort(conf_id, start, end, authors, title)
+
+The macros are defined in escop_tex/layout.tex.
+'''
+
+from hashlib import sha1
+from unicode_tex import unicode_to_tex
+
+TEX = "tex"
+RAW = "raw"
+
+
+def _tex(value):
+    return unicode_to_tex(u"{}".format(value))
+
+def _raw(value):
+    return value
+
+_converters = {TEX: _tex, RAW: _raw}
+
+
+def _literal(txt):
+    # txt as part of a format string
+    return txt.replace(u"{", u"{{").replace(u"}", u"}}")
+
+
+class MacroTemplate(object):
+    '''
+    Call of the macro \\<name> with a fixed list of arguments
+
+    before and after are written around the macro call. A macro without
+    arguments is terminated by "{}".
+    '''
+
+    __slots__ = ["name", "args", "before", "after", "fmt", "_converters"]
+
+    def __init__(self, name, args=(), before=u"", after=u"\n"):
+        self.name = name
+        self.args = tuple(args)
+        self.before = before
+        self.after = after
+        self._converters = tuple([_converters[a] for a in self.args])
+        if len(self.args) > 0:
+            arg_code = u"".join([u"{{{%d}}}" % i for i in range(len(self.args))])
+        else:
+            arg_code = u"{{}}"
+        self.fmt = _literal(before) + _literal(u"\\" + name) + arg_code + \
+                   _literal(after)
+
+    def __call__(self, *values):
+        if len(values) != len(self._converters):
+            raise TypeError("\\{0} takes {1} arguments ({2} given)".format(
+                                self.name, len(self._converters), len(values)))
+        return self.fmt.format(*[conv(v) for conv, v in zip(self._converters, values)])
+
+    def __repr__(self):
+        return "MacroTemplate({0!r}, {1!r})".format(self.name, self.args)
+
+
+# contributions.incl.tex
+overviewdaybegin = MacroTemplate("overviewdaybegin", [TEX], before=u"\n\n")
+overviewdayend = MacroTemplate("overviewdayend", before=u"\n\n")
+overviewtimeslotbegin = MacroTemplate("overviewtimeslotbegin", [TEX, TEX, TEX],
+                                      before=u"\n")
+overviewtimeslotend = MacroTemplate("overviewtimeslotend", before=u"\n")
+overviewsessionbegin = MacroTemplate("overviewsessionbegin", [TEX, TEX, TEX, TEX, RAW],
+                                     before=u"\n")
+overviewsessionend = MacroTemplate("overviewsessionend", after=u"\n\n")
+overviewposterbegin = MacroTemplate("overviewposterbegin")
+overviewposterend = MacroTemplate("overviewposterend", after=u"\n\n")
+talkshort = MacroTemplate("talkshort", [TEX, TEX, TEX, TEX, TEX], before=u"    ")
+postershort = MacroTemplate("postershort", [TEX, TEX, TEX], before=u"    ")
+
+# abstracts.incl.tex
+abstractsessionbegin = MacroTemplate("abstractsessionbegin", [TEX, TEX, TEX],
+                                     before=u"\n")
+abstractposterbegin = MacroTemplate("abstractposterbegin", [TEX, TEX, TEX],
+                                    before=u"\n")
+abstractsessionend = MacroTemplate("abstractsessionend", after=u"\n\n")
+escopabstract = MacroTemplate("escopabstract", [TEX, TEX, RAW, RAW, TEX, RAW, TEX],
+                              before=u"    ", after=u"\n\n")
+
+# authorindex.incl.tex
+authorindexref = MacroTemplate("authorindexref", [RAW], after=u"")
+
+# overview.incl.tex
+newcommand = MacroTemplate("newcommand", [RAW, RAW])
+
+
+_templates_hash = None
+
+def templates_hash():
+    # returns a hash of all templates, it changes, if the macro vocabulary
+    # changes (see latex_convert.FragmentCache)
+    global _templates_hash
+    if _templates_hash is None:
+        templates = sorted([(k, v.fmt, v.args) for k, v in globals().items()
+                            if isinstance(v, MacroTemplate)])
+        _templates_hash = sha1(repr(templates)).hexdigest()
+    return _templates_hash